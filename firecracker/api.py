@@ -8,15 +8,19 @@ DEFAULT_SCHEME = "http://"
 
 
 class Session(requests.Session):
-    """An HTTP over UNIX sockets Session with optimized connection pooling"""
+    """An HTTP over UNIX sockets Session with optimized connection pooling
+
+    UnixAdapter keeps one single-connection pool per request URL and closes
+    the least recently used pool once ``pool_connections`` is exceeded. The
+    limit is kept above the number of Firecracker endpoints the client uses,
+    so each endpoint keeps its connection alive across requests.
+    """
     def __init__(self):
         """Create a Session object."""
         super().__init__()
         adapter = UnixAdapter(
             pool_connections=20,
-            pool_maxsize=20,
-            max_retries=3,
-            pool_block=True
+            max_retries=3
         )
         self.mount(DEFAULT_SCHEME, adapter)
 
@@ -15,6 +15,7 @@ class Logger:
         "DEBUG": logging.DEBUG,
         "INFO": logging.INFO,
         "WARN": logging.WARNING,
+        "WARNING": logging.WARNING,
         "ERROR": logging.ERROR,
     }
 
@@ -55,6 +56,9 @@ class Logger:
     def set_level(self, level: str):
         """Set the logging level.
 
+        Without verbose, messages below WARNING are dropped by this instance
+        while the shared logger keeps the requested level.
+
         Args:
             level (str): Log level to set (INFO, ERROR, WARNING, DEBUG)
         """
@@ -62,37 +66,49 @@ class Logger:
         logging_level = self.LEVEL_MAP.get(level, logging.INFO)
         self.logger.setLevel(logging_level)
         self.current_level = level
+        self._threshold = logging_level if self.verbose else max(logging_level, logging.WARNING)
+
+    def is_enabled_for(self, level: str) -> bool:
+        """Check whether a message at the given level would be logged.
+
+        Args:
+            level (str): Level to check (INFO, ERROR, WARNING, DEBUG)
+
+        Returns:
+            bool: True if the message would be emitted
+        """
+        return self.LEVEL_MAP.get(level.upper(), logging.INFO) >= self._threshold
 
-    def __call__(self, level: str, message: str):
+    def __call__(self, level: str, message: str, *args):
         """Log a message at the specified level.
 
         Args:
             level (str): Level to log at (INFO, ERROR, WARNING, DEBUG)
-            message (str): Message to log
+            message (str): Message to log, optionally with %-style placeholders
+            *args: Values for the placeholders, formatted only if the
+                message is emitted
         """
         level = level.upper()
         if level not in self.LEVEL_MAP:
             level = "INFO"  # Default to INFO for unknown levels
 
         msg_level = self.LEVEL_MAP[level]
-        current_level = self.LEVEL_MAP[self.current_level]
 
-        if msg_level >= current_level:
-            log_method = getattr(self.logger, level.lower())
-            log_method(message)
+        if msg_level >= self._threshold:
+            self.logger.log(msg_level, message, *args)
 
-    def info(self, message: str):
+    def info(self, message: str, *args):
         """Log an info message."""
-        self("INFO", message)
+        self("INFO", message, *args)
 
-    def error(self, message: str):
+    def error(self, message: str, *args):
         """Log an error message."""
-        self("ERROR", message)
+        self("ERROR", message, *args)
 
-    def warn(self, message: str):
+    def warn(self, message: str, *args):
         """Log a warning message."""
-        self("WARN", message)
+        self("WARN", message, *args)
 
-    def debug(self, message: str):
+    def debug(self, message: str, *args):
         """Log a debug message."""
-        self("DEBUG", message)
\ No newline at end of file
+        self("DEBUG", message, *args)
\ No newline at end of file
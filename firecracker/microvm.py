@@ -1,14 +1,22 @@
 import os
+import re
 import sys
-import tty
+import copy
+import mmap
 import time
-import json
-import select
-import termios
+import socket
+import stat
+import selectors
 import docker
+import shutil
 import tarfile
 import tempfile
+import requests
+from pathlib import Path
+from collections import OrderedDict
 from http import HTTPStatus
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
 from typing import List, Dict
 from firecracker.config import MicroVMConfig
 from firecracker.api import Api
@@ -16,10 +24,11 @@ from firecracker.logger import Logger
 from firecracker.network import NetworkManager
 from firecracker.process import ProcessManager
 from firecracker.vmm import VMMManager
-from firecracker.utils import run, get_public_ip, validate_ip_address, generate_id, generate_name, generate_mac_address
+from firecracker.utils import run, get_public_ip, validate_ip_address, generate_id, generate_name, generate_mac_address, clone_file, json_loads, json_dumps
 from firecracker.exceptions import VMMError, ConfigurationError
-from paramiko import SSHClient, AutoAddPolicy, SSHException
-from tenacity import retry, stop_after_attempt, wait_fixed, retry_if_exception_type
+from tenacity import Retrying, stop_after_attempt, wait_fixed, retry_if_exception_type
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 
 
 class MicroVM:
@@ -58,6 +67,11 @@ class MicroVM:
         ConfigurationError: If the configuration is invalid
         ProcessError: If the process fails
     """
+    _CONFIG_CACHE_SIZE = 64
+    _config_cache: Dict[str, tuple] = OrderedDict()
+    _PORT_RE = re.compile(r"\s*(\d+)\s*")
+    _http: requests.Session = None
+
     def __init__(self, name: str = None, kernel_file: str = None, kernel_url: str = None, initrd_file: str = None, init_file: str = None,
                  image: str = None, base_rootfs: str = None, rootfs_size: str = None, overlayfs: bool = False, overlayfs_file: str = None,
                  vcpu: int = None, memory: int = None, ip_addr: str = None,
@@ -87,13 +101,33 @@ class MicroVM:
         if user_data_file and user_data:
             raise ValueError("Cannot specify both user_data and user_data_file. Use only one of them.")
         if user_data_file:
-            if not os.path.exists(user_data_file):
+            try:
+                with open(user_data_file, 'rb') as f:
+                    st = os.fstat(f.fileno())
+                    if stat.S_ISREG(st.st_mode) and st.st_size:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            self._user_data = str(memoryview(mm), 'utf-8')
+                    else:
+                        self._user_data = f.read().decode()
+            except FileNotFoundError:
                 raise ValueError(f"User data file not found: {user_data_file}")
-            with open(user_data_file, 'r') as f:
-                self._user_data = f.read()
         else:
             self._user_data = user_data
 
+        if self._mmds_enabled:
+            self._mmds_payload = {
+                "latest": {
+                    "meta-data": {
+                        "instance-id": self._microvm_id,
+                        "local-hostname": self._microvm_name
+                    }
+                }
+            }
+            if self._user_data:
+                self._mmds_payload["latest"]["user-data"] = self._user_data
+        else:
+            self._mmds_payload = None
+
         self._labels = labels or {}
 
         self._iface_name = self._network.get_interface_name()
@@ -107,10 +141,12 @@ class MicroVM:
             self._ip_addr = self._config.ip_addr
         self._gateway_ip = self._network.get_gateway_ip(self._ip_addr)
 
-        self._socket_file = f"{self._config.data_path}/{self._microvm_id}/firecracker.socket"
-        self._vmm_dir = f"{self._config.data_path}/{self._microvm_id}"
-        self._log_dir = f"{self._vmm_dir}/logs"
-        self._rootfs_dir = f"{self._vmm_dir}/rootfs"
+        self._vmm_dir = os.path.join(self._config.data_path, self._microvm_id)
+        self._socket_file = os.path.join(self._vmm_dir, "firecracker.socket")
+        self._config_path = os.path.join(self._vmm_dir, "config.json")
+        self._log_dir = os.path.join(self._vmm_dir, "logs")
+        self._log_file = os.path.join(self._log_dir, f"{self._microvm_id}.log")
+        self._rootfs_dir = os.path.join(self._vmm_dir, "rootfs")
 
         self._docker = docker.from_env()
         self._docker_image = image
@@ -155,10 +191,12 @@ class MicroVM:
             self._overlayfs_name = os.path.basename(self._overlayfs_file.replace('./', ''))
             self._overlayfs_dir = os.path.join(self._rootfs_dir, self._overlayfs_name)
 
+        self._boot_args = self._build_boot_args()
+
         self._mem_file_path = f"{self._config.snapshot_path}/{self._microvm_id}/memory"
         self._snapshot_path = f"{self._config.snapshot_path}/{self._microvm_id}/snapshot"
 
-        self._ssh_client = SSHClient()
+        self._ssh_client = None
         self._expose_ports = expose_ports
         self._host_ip = get_public_ip()
         self._host_port = self._parse_ports(host_port)
@@ -166,7 +204,7 @@ class MicroVM:
 
         self._vsock_enabled = vsock_enabled or self._config.vsock_enabled
         self._vsock_guest_cid = vsock_guest_cid or self._config.vsock_guest_cid
-        self._vsock_uds_path = f"{self._config.data_path}/{self._microvm_id}/v.sock"
+        self._vsock_uds_path = os.path.join(self._vmm_dir, "v.sock")
 
         self._api = self._vmm.get_api(self._microvm_id)
 
@@ -222,14 +260,10 @@ class MicroVM:
         if not id:
             return f"VMM with ID {id} does not exist"
 
-        config_file = f"{self._config.data_path}/{id}/config.json"
-        if not os.path.exists(config_file):
-            return "VMM ID not exist"
-
         try:
-            with open(config_file, "r") as f:
-                config = json.load(f)
-                return config
+            return copy.deepcopy(self._load_config(id))
+        except FileNotFoundError:
+            return "VMM ID not exist"
         except Exception as e:
             raise VMMError(f"Failed to inspect VMM {id}: {str(e)}")
 
@@ -245,12 +279,11 @@ class MicroVM:
             return "No VMM ID specified for checking status"
         
         try:
-            with open(f"{self._config.data_path}/{id}/config.json", "r") as f:
-                config = json.load(f)
-                if config['State']['Running']:
-                    return f"VMM {id} is running"
-                elif config['State']['Paused']:
-                    return f"VMM {id} is paused"
+            config = self._load_config(id)
+            if config['State']['Running']:
+                return f"VMM {id} is running"
+            elif config['State']['Paused']:
+                return f"VMM {id} is paused"
 
         except Exception as e:
             raise VMMError(f"Failed to get status for VMM {id}: {str(e)}")
@@ -283,8 +316,7 @@ class MicroVM:
         Returns:
             dict: Status message indicating the result of the create operation.
         """
-        vmm_dir = f"{self._config.data_path}/{self._microvm_id}"
-        if os.path.exists(vmm_dir):
+        if os.path.exists(self._vmm_dir):
             return f"VMM with ID {self._microvm_id} already exists"
 
         try:
@@ -294,42 +326,37 @@ class MicroVM:
                 raise ValueError("base_rootfs is required when no kernel_url or image is provided")
 
             for file_path, name in [(self._kernel_file, "kernel file"), (self._base_rootfs, "base rootfs")]:
-                if not os.path.exists(file_path):
+                try:
+                    st = os.stat(file_path)
+                except FileNotFoundError:
                     raise FileNotFoundError(f"{name.capitalize()} not found: {file_path}")
+                self._logger.debug("Using %s %s (%d bytes)", name, file_path, st.st_size)
 
             if self._vmm.check_network_overlap(self._ip_addr):
                 return f"IP address {self._ip_addr} is already in use"
 
             if self._docker_image:
                 if not os.path.exists(self._base_rootfs):
-                    if self._config.verbose:
-                        self._logger.info(f"Building rootfs from Docker image: {self._docker_image}")
+                    self._logger.info("Building rootfs from Docker image: %s", self._docker_image)
                     self._build_rootfs(self._docker_image, self._base_rootfs, self._rootfs_size)
 
-            self._network.setup(
-                tap_name=self._host_dev_name,
-                iface_name=self._iface_name,
-                gateway_ip=self._gateway_ip,
-            )
-
-            self._run_firecracker()
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                network_setup = executor.submit(
+                    self._network.setup,
+                    tap_name=self._host_dev_name,
+                    iface_name=self._iface_name,
+                    gateway_ip=self._gateway_ip,
+                )
+                self._run_firecracker(pending=[network_setup])
             if snapshot:
                 if not memory_path or not snapshot_path:
                     raise ValueError("memory_path and snapshot_path are required when snapshot is True")
                 self.snapshot(id=self._microvm_id, action="load", memory_path=memory_path, snapshot_path=snapshot_path)
             else:
-                self._configure_vmm_boot_source()
-                self._configure_vmm_root_drive()
-                self._configure_vmm_resources()
-                self._configure_vmm_network()
-                if self._mmds_enabled:
-                    self._configure_vmm_mmds()
-                if self._vsock_enabled:
-                    self._configure_vmm_vsock()
+                self._basic_config()
 
             self._api.actions.put(action_type="InstanceStart")
-            if self._config.verbose:
-                self._logger.info(f"VMM {self._microvm_id} started")
+            self._logger.info("VMM %s started", self._microvm_id)
 
             if self._expose_ports:
                 if not self._host_port or not self._dest_port:
@@ -341,7 +368,15 @@ class MicroVM:
 
             pid, create_time = self._process.get_pid(self._microvm_id)
 
-            if self._process.is_running(self._microvm_id):
+            try:
+                os.kill(pid, 0)
+                running = True
+            except ProcessLookupError:
+                running = False
+            except PermissionError:
+                running = True
+
+            if running:
                 self._vmm.create_vmm_json_file(
                     id=self._microvm_id,
                     Name=self._microvm_name,
@@ -381,14 +416,10 @@ class MicroVM:
             id = id if id else self._microvm_id
             self._vmm.update_vmm_state(id, "Paused")
 
-            config_path = f"{self._config.data_path}/{id}/config.json"
             try:
-                with open(config_path, "r+") as file:
-                    config = json.load(file)
-                    config['State']['Paused'] = "true"
-                    file.seek(0)
-                    json.dump(config, file)
-                    file.truncate()
+                config = copy.deepcopy(self._load_config(id))
+                config['State']['Paused'] = "true"
+                self._write_config(id, config)
             except Exception as e:
                 raise VMMError(f"Failed to update VMM state: {str(e)}")
 
@@ -414,14 +445,10 @@ class MicroVM:
             id = id if id else self._microvm_id
             self._vmm.update_vmm_state(id, "Resumed")
 
-            config_path = f"{self._config.data_path}/{id}/config.json"
             try:
-                with open(config_path, "r+") as file:
-                    config = json.load(file)
-                    config['State']['Paused'] = "false"
-                    file.seek(0)
-                    json.dump(config, file)
-                    file.truncate()
+                config = copy.deepcopy(self._load_config(id))
+                config['State']['Paused'] = "false"
+                self._write_config(id, config)
             except Exception as e:
                 raise VMMError(f"Failed to update VMM state: {str(e)}")
 
@@ -449,18 +476,22 @@ class MicroVM:
                 return "No VMMs available to delete"
 
             if all:
-                for vmm in vmm_list:
-                    self._vmm.delete_vmm(vmm['id'])
+                try:
+                    self._vmm.delete_vmm(vmm_list=vmm_list)
+                finally:
+                    for vmm in vmm_list:
+                        self._config_cache.pop(vmm['id'], None)
                 return "All VMMs are deleted"
 
             target_id = id if id else self._microvm_id
             if not target_id:
                 return "No VMM ID specified for deletion"
 
-            if target_id not in [vmm['id'] for vmm in vmm_list]:
+            if target_id not in {vmm['id'] for vmm in vmm_list}:
                 return f"VMM with ID {target_id} not found"
 
-            self._vmm.delete_vmm(target_id)
+            self._vmm.delete_vmm(target_id, vmm_list=vmm_list)
+            self._config_cache.pop(target_id, None)
             return f"VMM {target_id} is deleted"
 
         except Exception as e:
@@ -494,18 +525,21 @@ class MicroVM:
                 return "No VMMs available to connect"
 
             id = id if id else self._microvm_id
-            available_vmm_ids = [vmm['id'] for vmm in vmm_list]
+            available_vmm_ids = {vmm['id'] for vmm in vmm_list}
 
             if id not in available_vmm_ids:
                 return f"VMM with ID {id} does not exist"
 
-            with open(f"{self._config.data_path}/{id}/config.json", "r") as f:
-                ip_addr = json.load(f)['Network'][f"tap_{id}"]['IPAddress']
+            ip_addr = self._load_config(id)['Network']["tap_" + id]['IPAddress']
+
+            import tty
+            import termios
+            from paramiko import SSHClient
 
+            self._ssh_client = SSHClient()
             self._establish_ssh_connection(ip_addr, username, key_path, id)
 
-            if self._config.verbose:
-                self._logger.info(f"Attempting SSH connection to {ip_addr} with user {self._config.ssh_user}")
+            self._logger.info("Attempting SSH connection to %s with user %s", ip_addr, self._config.ssh_user)
 
             try:
                 channel = self._ssh_client.invoke_shell()
@@ -515,27 +549,37 @@ class MicroVM:
                 except (termios.error, AttributeError):
                     old_settings = None
 
+                selector = selectors.DefaultSelector()
+                selector.register(channel, selectors.EVENT_READ)
+                if old_settings:
+                    selector.register(sys.stdin, selectors.EVENT_READ)
+                    timeout = None
+                else:
+                    timeout = 5
+
                 try:
-                    while True:
-                        if channel.exit_status_ready():
+                    session_open = True
+                    while session_open:
+                        events = selector.select(timeout=timeout)
+                        if not events:
                             break
 
-                        if channel.recv_ready():
-                            data = channel.recv(1024)
-                            if len(data) == 0:
-                                break
-                            sys.stdout.buffer.write(data)
-                            sys.stdout.flush()
-
-                        if old_settings and sys.stdin in select.select([sys.stdin], [], [], 0.1)[0]:
-                            char = sys.stdin.read(1)
-                            if not char:
-                                break
-                            channel.send(char)
-                        elif not old_settings:
-                            time.sleep(5)
-                            break
+                        for key, _ in events:
+                            if key.fileobj is channel:
+                                data = channel.recv(4096)
+                                if not data:
+                                    session_open = False
+                                    break
+                                sys.stdout.buffer.write(data)
+                                sys.stdout.flush()
+                            else:
+                                data = os.read(sys.stdin.fileno(), 4096)
+                                if not data:
+                                    session_open = False
+                                    break
+                                channel.sendall(data)
                 finally:
+                    selector.close()
                     if old_settings:
                         termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
                     channel.close()
@@ -567,16 +611,15 @@ class MicroVM:
                 return "No VMMs available"
 
             id = id if id else self._microvm_id 
-            available_vmm_ids = [vmm['id'] for vmm in vmm_list]
+            available_vmm_ids = {vmm['id'] for vmm in vmm_list}
             if id not in available_vmm_ids:
                 return f"VMM with ID {id} does not exist" 
 
-            config_path = f"{self._config.data_path}/{id}/config.json"
-            with open(config_path, "r") as f:
-                config = json.load(f)
-                if 'Network' not in config or f"tap_{id}" not in config['Network']:
-                    raise VMMError(f"Network configuration not found for VMM {id}")
-                dest_ip = config['Network'][f"tap_{id}"]['IPAddress']
+            config = self._load_config(id)
+            tap_key = "tap_" + id
+            if 'Network' not in config or tap_key not in config['Network']:
+                raise VMMError(f"Network configuration not found for VMM {id}")
+            dest_ip = config['Network'][tap_key]['IPAddress']
 
             if not dest_ip:
                 raise VMMError(f"Could not determine destination IP address for VMM {id}")
@@ -611,24 +654,21 @@ class MicroVM:
 
             if action == "create":
                 if self._vmm.get_vmm_state(id) == "Paused":
-                    if self._config.verbose:
-                        self._logger.info(f"VMM {id} is already paused")
+                    self._logger.info("VMM %s is already paused", id)
                 else:
-                    if self._config.verbose:
-                        self._logger.info(f"Pausing VMM {id} to create snapshot")
+                    self._logger.info("Pausing VMM %s to create snapshot", id)
                     self._vmm.update_vmm_state(id, "Paused")
 
                 if not os.path.exists(f"{self._config.snapshot_path}/{id}"):
                     os.makedirs(f"{self._config.snapshot_path}/{id}", mode=0o755)
-                    self._logger.info(f"Created VMM {id} snapshot directory")
+                    self._logger.info("Created VMM %s snapshot directory", id)
 
                 self._api.create_snapshot.put(
                     mem_file_path=self._mem_file_path if memory_path is None else memory_path,
                     snapshot_path=self._snapshot_path if snapshot_path is None else snapshot_path,
                 )
-                if self._config.verbose:
-                    self._logger.debug(f"Snapshot created at {self._snapshot_path}")
-                    self._logger.info(f"Snapshot created for VMM {id}")
+                self._logger.debug("Snapshot created at %s", self._snapshot_path)
+                self._logger.info("Snapshot created for VMM %s", id)
                 self._vmm.update_vmm_state(id, "Resumed")
             elif action == "load":
                 self._api.load_snapshot.put(
@@ -646,9 +686,8 @@ class MicroVM:
                         }
                     ]
                 )
-                if self._config.verbose:
-                    self._logger.debug(f"Snapshot loaded from {snapshot_path if snapshot_path is not None else self._snapshot_path}")
-                    self._logger.info(f"Snapshot loaded for VMM {id}")
+                self._logger.debug("Snapshot loaded from %s", snapshot_path if snapshot_path is not None else self._snapshot_path)
+                self._logger.info("Snapshot loaded for VMM %s", id)
             else:
                 raise ValueError("Invalid action. Must be 'create' or 'load'")
 
@@ -673,244 +712,209 @@ class MicroVM:
             return [port_value]
 
         if isinstance(port_value, str):
-            if ',' in port_value:
-                return [int(p.strip()) for p in port_value.split(',') if p.strip().isdigit()]
-            elif port_value.isdigit():
-                return [int(port_value)]
+            matches = (self._PORT_RE.fullmatch(p) for p in port_value.split(','))
+            return [int(m.group(1)) for m in matches if m]
 
         if isinstance(port_value, list):
-            ports = []
-            for p in port_value:
-                if isinstance(p, int):
-                    ports.append(p)
-                elif isinstance(p, str) and p.isdigit():
-                    ports.append(int(p))
-            return ports
+            return [
+                p if isinstance(p, int) else int(p)
+                for p in port_value
+                if isinstance(p, int) or (isinstance(p, str) and p.isdigit())
+            ]
 
         return []
 
-    @property
-    def _boot_args(self):
+    def _build_boot_args(self) -> str:
         """Generate boot arguments using current configuration.
-        
+
         Returns:
             str: Boot arguments
         """
-        common_args = (
-            "console=ttyS0 reboot=k pci=off panic=1 "
-            f"ip={self._ip_addr}::{self._gateway_ip}:255.255.255.0:"
-            f"{self._microvm_name}:{self._iface_name}:on"
-        )
-
         if self._mmds_enabled:
-            return f"{common_args} init={self._init_file}"
+            init_args = f" init={self._init_file}"
         elif self._overlayfs:
-            return f"{common_args} init={self._init_file} overlay_root=/vdb"
+            init_args = f" init={self._init_file} overlay_root=/vdb"
         else:
-            return f"{common_args}"
-
-    def _configure_vmm_boot_source(self):
-        """Configure the boot source for the microVM.
-        
-        Raises:
-            ConfigurationError: If boot source configuration fails
-        """
-        try:
-            boot_params = {
-                'kernel_image_path': self._kernel_file,
-                'boot_args': self._boot_args
-            }
-
-            if self._initrd_file:
-                boot_params['initrd_path'] = self._initrd_file
-                self._logger.info(f"Using initrd file: {self._initrd_file}")
-
-            boot_response = self._api.boot.put(**boot_params)
-
-            if self._config.verbose:
-                self._logger.debug(f"Boot configuration response: {boot_response.status_code}")
-                self._logger.info("Boot source configured")
+            init_args = ""
 
-        except Exception as e:
-            raise ConfigurationError(f"Failed to configure boot source: {str(e)}")
-
-    def _configure_vmm_root_drive(self):
-        """Configure the root drive for the microVM.
-        
-        Raises:
-            ConfigurationError: If root drive configuration fails
-        """
-        try:
-            rootfs_path = self._rootfs_file
-            if self._overlayfs and self._base_rootfs:
-                rootfs_path = self._base_rootfs
-            
-            self._api.drive.put(
-                drive_id="rootfs",
-                path_on_host=rootfs_path,
-                is_root_device=True if self._initrd_file is None else False,
-                is_read_only=self._overlayfs is True
-            )
-            if self._config.verbose:
-                self._logger.info("Root drive configured")
-
-            if self._overlayfs:
-                self._api.drive.put(
-                    drive_id="overlayfs",
-                    path_on_host=self._overlayfs_file,
-                    is_root_device=False,
-                    is_read_only=False
-                )
+        return (
+            "console=ttyS0 reboot=k pci=off panic=1 "
+            f"ip={self._ip_addr}::{self._gateway_ip}:255.255.255.0:"
+            f"{self._microvm_name}:{self._iface_name}:on{init_args}"
+        )
 
-                if self._config.verbose:
-                    self._logger.info("Overlayfs drive configured")
+    def _basic_config(self):
+        """Apply the pre-boot configuration of the microVM.
 
-        except Exception:
-            raise ConfigurationError("Failed to configure root drive")
+        The configuration is applied in phases. Requests within a phase have
+        no ordering constraint between each other and are issued concurrently
+        over the shared API client. Every request in a phase targets a
+        different endpoint, and the client keeps a connection alive per
+        endpoint. Each phase waits for the previous one to finish.
 
-    def _configure_vmm_resources(self):
-        """Configure machine resources (vCPUs and memory).
-        
         Raises:
-            ConfigurationError: If machine configuration fails
+            ConfigurationError: If any configuration step fails
         """
-        try:
-            self._api.machine_config.put(
-                vcpu_count=self._vcpu,
-                mem_size_mib=self._memory
-            )
+        if self._initrd_file:
+            self._logger.info("Using initrd file: %s", self._initrd_file)
 
-            if self._config.verbose:
-                self._logger.info(f"Configured VMM with {self._vcpu} vCPUs and {self._memory} MiB RAM")
+        phases = self._configure_steps()
 
-        except Exception as e:
-            raise ConfigurationError(f"Failed to configure VMM resources: {str(e)}")
+        with ThreadPoolExecutor(max_workers=max(len(steps) for steps in phases)) as executor:
+            for steps in phases:
+                futures = [executor.submit(self._put_config, *step) for step in steps]
+                done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+                for future in done:
+                    future.result()
 
-    def _configure_vmm_network(self):
-        """Configure network interface.
+    def _configure_steps(self) -> list:
+        """Build the pre-boot configuration requests, grouped in phases.
 
-        Raises:
-            NetworkError: If network configuration fails
-        """
-        try:
-            response = self._api.network.put(
-                iface_id=self._iface_name,
-                host_dev_name=self._host_dev_name
-            )
-
-            if self._config.verbose:
-                self._logger.debug(f"Network configuration response: {response.status_code}")
-                self._logger.info("Configured network interface")
-
-        except Exception as e:
-            raise ConfigurationError(f"Failed to configure network: {str(e)}")
+        Each step is a ``(description, resource, params)`` tuple. MMDS
+        references the network interface by ID, so it is configured after the
+        first phase, and its data store is filled once it is configured. The
+        overlayfs drive also waits for the first phase: without a root device
+        (initrd boot) Firecracker attaches drives in the order they are added,
+        and ``overlay_root=/vdb`` relies on the root drive coming first.
 
-    def _configure_vmm_mmds(self):
-        """Configure MMDS (Microvm Metadata Service) if enabled.
-
-        MMDS is a service that provides metadata to the microVM.
+        Returns:
+            list: Phases, each a list of steps
         """
-        try:
-            if self._config.verbose:
-                self._logger.debug("MMDS is " + ("disabled" if not self._mmds_enabled else "enabled, configuring MMDS network..."))
-
-            if not self._mmds_enabled:
-                return
-
-            self._api.mmds_config.put(
-                version="V2",
-                ipv4_address=self._mmds_ip,
-                network_interfaces=[self._iface_name]
-            )
-
-            user_data = {
-                "latest": {
-                    "meta-data": {
-                        "instance-id": self._microvm_id,
-                        "local-hostname": self._microvm_name
-                    }
-                }
-            }
-
-            if self._user_data:
-                user_data["latest"]["user-data"] = self._user_data
-                if hasattr(self, '_user_data_file') and self._user_data_file:
-                    user_data["latest"]["meta-data"]["user-data-file"] = self._user_data_file
-
-            mmds_data_response = self._api.mmds.put(**user_data)
+        api = self._api
+
+        rootfs_path = self._rootfs_file
+        if self._overlayfs and self._base_rootfs:
+            rootfs_path = self._base_rootfs
+
+        boot_params = {
+            "kernel_image_path": self._kernel_file,
+            "boot_args": self._boot_args
+        }
+        if self._initrd_file:
+            boot_params["initrd_path"] = self._initrd_file
+
+        first_phase = [
+            ("boot source", api.boot, boot_params),
+            ("root drive", api.drive, {
+                "drive_id": "rootfs",
+                "path_on_host": rootfs_path,
+                "is_root_device": self._initrd_file is None,
+                "is_read_only": self._overlayfs is True
+            }),
+            ("VMM resources", api.machine_config, {
+                "vcpu_count": self._vcpu,
+                "mem_size_mib": self._memory
+            }),
+            ("network", api.network, {
+                "iface_id": self._iface_name,
+                "host_dev_name": self._host_dev_name
+            }),
+        ]
+        if self._vsock_enabled:
+            first_phase.append(("Vsock", api.vsock, {
+                "guest_cid": self._vsock_guest_cid,
+                "uds_path": self._vsock_uds_path
+            }))
+
+        second_phase = []
+        if self._overlayfs:
+            second_phase.append(("overlayfs drive", api.drive, {
+                "drive_id": "overlayfs",
+                "path_on_host": self._overlayfs_file,
+                "is_root_device": False,
+                "is_read_only": False
+            }))
+        if self._mmds_enabled:
+            second_phase.append(("MMDS", api.mmds_config, {
+                "version": "V2",
+                "ipv4_address": self._mmds_ip,
+                "network_interfaces": [self._iface_name]
+            }))
+
+        phases = [first_phase]
+        if second_phase:
+            phases.append(second_phase)
+        if self._mmds_enabled:
+            phases.append([("MMDS data", api.mmds, self._mmds_payload)])
 
-            if self._config.verbose:
-                self._logger.debug(f"MMDS data response: {mmds_data_response.status_code}")
-                self._logger.info("MMDS data configured")
+        return phases
 
-        except Exception as e:
-            raise ConfigurationError(f"Failed to configure MMDS: {str(e)}")
+    def _put_config(self, description: str, resource, params: dict):
+        """Send a single pre-boot configuration request.
 
-    def _configure_vmm_vsock(self):
-        """Configure Vsock if enabled.
+        Args:
+            description (str): What is being configured, used in messages
+            resource (Resource): API resource to PUT to
+            params (dict): Request body
 
-        Vsock is a communication channel between the microVM and the host.
+        Raises:
+            ConfigurationError: If the request fails
         """
         try:
-            if self._config.verbose:
-                self._logger.debug("Vsock is " + ("disabled" if not self._vsock_enabled else "enabled, configuring Vsock..."))
-
-            self._api.vsock.put(
-                guest_cid=self._vsock_guest_cid,
-                uds_path=self._vsock_uds_path
-            )
-
-            if self._config.verbose:
-                self._logger.debug(f"Vsock configured with guest CID {self._vsock_guest_cid} and UDS path {self._vsock_uds_path}")
-                self._logger.info("Vsock configured")
+            response = resource.put(**params)
+            self._logger.debug("%s configuration response: %s", description, response.status_code)
+            self._logger.info("Configured %s", description)
 
         except Exception as e:
-            raise ConfigurationError(f"Failed to configure Vsock: {str(e)}")
+            raise ConfigurationError(f"Failed to configure {description}: {str(e)}")
 
-    def _run_firecracker(self):
+    def _run_firecracker(self, pending: list = None):
         """Run the Firecracker process.
 
+        Args:
+            pending (list, optional): Futures for host-side preparation running
+                alongside the process startup. They are joined together with
+                the rootfs copy before the API socket is probed, and before
+                cleanup on failure.
+
         Raises:
             VMMError: If Firecracker process fails to start
             ConfigurationError: If Firecracker configuration fails
             NetworkError: If network configuration fails
             SSHException: If SSH connection fails
         """
-        try:
-            self._vmm.socket_file(self._microvm_id)
+        pending = list(pending or [])
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            try:
+                self._vmm.socket_file(self._microvm_id)
 
-            paths = [self._vmm_dir, f"{self._vmm_dir}/rootfs", f"{self._vmm_dir}/logs"]
-            for path in paths:
-                self._vmm.create_vmm_dir(path)
+                os.makedirs(self._rootfs_dir, exist_ok=True)
+                os.makedirs(self._log_dir, exist_ok=True)
 
-            if not self._overlayfs and self._base_rootfs and os.path.exists(self._base_rootfs):
-                run(f"cp {self._base_rootfs} {self._rootfs_file}", capture_output=True)
-                if self._config.verbose:
-                    self._logger.debug(f"Copied base rootfs from {self._base_rootfs} to {self._rootfs_file}")
+                # Firecracker only opens the rootfs when the drive is
+                # configured, so the copy can run while the process starts.
+                if not self._overlayfs and self._base_rootfs:
+                    pending.append(executor.submit(clone_file, self._base_rootfs, self._rootfs_file))
 
-            self._vmm.create_log_file(self._microvm_id, f"{self._microvm_id}.log")
+                Path(self._log_file).touch(exist_ok=True)
 
-            args = [
-                "--api-sock", self._socket_file,
-                "--id", self._microvm_id,
-                "--log-path", f"{self._log_dir}/{self._microvm_id}.log"
-            ]
+                args = [
+                    "--api-sock", self._socket_file,
+                    "--id", self._microvm_id,
+                    "--log-path", self._log_file
+                ]
 
-            self._process.start(self._microvm_id, args)
-            self._process.is_running(self._microvm_id)
+                self._process.start(self._microvm_id, args)
 
-            for _ in range(3):
-                try:
-                    response = self._api.describe.get()
-                    if response.status_code == HTTPStatus.OK:
-                        return Api(self._socket_file)
-                except Exception:
-                    pass
-                time.sleep(0.5)
+                for future in pending:
+                    future.result()
+
+                if not self._overlayfs and self._base_rootfs:
+                    self._logger.debug("Copied base rootfs from %s to %s", self._base_rootfs, self._rootfs_file)
+
+                for _ in range(3):
+                    try:
+                        response = self._api.describe.get()
+                        if response.status_code == HTTPStatus.OK:
+                            return Api(self._socket_file)
+                    except Exception:
+                        pass
+                    time.sleep(0.5)
 
-        except Exception as exc:
-            self._vmm.cleanup(self._microvm_id)
-            raise VMMError(str(exc))
+            except Exception as exc:
+                wait(pending)
+                self._vmm.cleanup(self._microvm_id)
+                raise VMMError(str(exc))
 
     def _download_kernel(self, url: str, path: str):
         """Download the kernel file from the provided URL.
@@ -923,7 +927,6 @@ class MicroVM:
             ValueError: If URL is invalid or doesn't contain http/https
             VMMError: If download fails
         """
-        import urllib.request
         import urllib.parse
         
         if not url or not isinstance(url, str):
@@ -941,27 +944,145 @@ class MicroVM:
             raise ValueError(f"Invalid URL format: {str(e)}")
 
         if os.path.exists(path):
-            if self._config.verbose:
-                self._logger.info(f"Kernel file already exists: {path}")
+            self._logger.info("Kernel file already exists: %s", path)
             return
 
         try:
-            if self._config.verbose:
-                self._logger.info(f"Downloading kernel file from {url}...")
+            cache_path = self._download_cached(url)
+            try:
+                os.link(cache_path, path)
+            except OSError:
+                shutil.copyfile(cache_path, path)
 
-            urllib.request.urlretrieve(url, path)
+            self._logger.info("Kernel file downloaded successfully: %s", path)
 
-            if not os.path.exists(path) or os.path.getsize(path) == 0:
-                raise VMMError("Download failed: file is empty or was not created")
-                
-            if self._config.verbose:
-                self._logger.info(f"Kernel file downloaded successfully: {path}")
-                
         except Exception as e:
             if os.path.exists(path):
                 os.remove(path)
             raise VMMError(f"Failed to download kernel from {url}: {str(e)}")
 
+    def _download_cached(self, url: str) -> str:
+        """Download a URL into the local download cache.
+
+        Files are cached under ``<data_path>/cache`` keyed by the SHA-256 of
+        the URL. The ETag, Last-Modified and Content-Length of the download
+        are kept in a ``.meta`` sidecar and compared against a HEAD request,
+        so an unchanged file is never fetched twice. If the HEAD request
+        fails, an existing cached copy is used as is.
+
+        Args:
+            url (str): URL to download
+
+        Returns:
+            str: Path to the cached file
+
+        Raises:
+            VMMError: If the download fails
+        """
+        import hashlib
+        import urllib.parse
+
+        session = self._http_session()
+        cache_dir = os.path.join(self._config.data_path, "cache")
+        os.makedirs(cache_dir, exist_ok=True)
+        key = hashlib.sha256(url.encode()).hexdigest()
+        filename = os.path.basename(urllib.parse.urlparse(url).path) or "download"
+        cache_path = os.path.join(cache_dir, f"{key}-{filename}")
+        meta_path = f"{cache_path}.meta"
+
+        if os.path.exists(cache_path):
+            try:
+                with open(meta_path, "rb") as f:
+                    meta = json_loads(f.read())
+            except (OSError, ValueError):
+                meta = None
+
+            try:
+                response = session.head(url, allow_redirects=True, timeout=10)
+                response.raise_for_status()
+                remote = self._cache_validators(response.headers)
+            except requests.RequestException:
+                remote = None
+
+            if meta is not None and (remote is None or (any(remote.values()) and remote == meta)):
+                self._logger.info("Using cached download for %s: %s", url, cache_path)
+                return cache_path
+
+        self._logger.info("Downloading %s...", url)
+
+        tmp_path = f"{cache_path}.tmp"
+        try:
+            with session.get(url, stream=True, timeout=10) as response, \
+                    open(tmp_path, "wb", buffering=DOWNLOAD_CHUNK_SIZE) as f:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                validators = self._cache_validators(response.headers)
+                content_length = int(validators["size"] or 0)
+                if content_length:
+                    try:
+                        os.posix_fallocate(f.fileno(), 0, content_length)
+                    except OSError:
+                        pass
+
+                shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+                f.truncate()
+
+                # Write the data back and drop it from the page cache, so a
+                # large download does not evict the hot pages of running VMs.
+                # The sync also makes the rename below crash-safe.
+                f.flush()
+                os.fdatasync(f.fileno())
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+            if os.path.getsize(tmp_path) == 0:
+                raise VMMError("Download failed: file is empty")
+
+            os.replace(tmp_path, cache_path)
+            with open(meta_path, "wb") as f:
+                f.write(json_dumps(validators))
+
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        return cache_path
+
+    @classmethod
+    def _http_session(cls) -> requests.Session:
+        """Get the HTTP session shared by all downloads.
+
+        Keeps connections alive across requests, so the cache validation
+        HEAD and the following GET, as well as later downloads from the same
+        host, reuse one TCP/TLS connection.
+
+        Returns:
+            requests.Session: Shared session
+        """
+        if cls._http is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            cls._http = session
+        return cls._http
+
+    @staticmethod
+    def _cache_validators(headers) -> dict:
+        """Extract the cache validators from HTTP response headers.
+
+        Args:
+            headers: Response headers
+
+        Returns:
+            dict: ETag, Last-Modified and Content-Length values
+        """
+        return {
+            "etag": headers.get("ETag", ""),
+            "last_modified": headers.get("Last-Modified", ""),
+            "size": headers.get("Content-Length", ""),
+        }
+
     def _convert_memory_size(self, size):
         """Convert memory size to MiB.
         
@@ -1038,16 +1159,14 @@ class MicroVM:
         """
         try:
             local = self._docker.images.get(image)
-            if self._config.verbose:
-                self._logger.info(f"Docker image {image} already exists")
+            self._logger.info("Docker image %s already exists", image)
             if local.tags:
                 return local.tags[0]
             else:
                 return local.id
 
         except docker.errors.ImageNotFound:
-            if self._config.verbose:
-                self._logger.info(f"Pulling Docker image: {image}")
+            self._logger.info("Pulling Docker image: %s", image)
 
             pulled = self._docker.images.pull(image)
 
@@ -1076,14 +1195,12 @@ class MicroVM:
             if not image:
                 raise VMMError(f"Failed to download Docker image {image}")
 
-            if self._config.verbose:
-                self._logger.debug(f"Creating container: {container_name}")
+            self._logger.debug("Creating container: %s", container_name)
             
             container = self._docker.containers.create(image, name=container_name)
             export_data = container.export()
 
-            if self._config.verbose:
-                self._logger.debug(f"Exporting container to {tar_file}")
+            self._logger.debug("Exporting container to %s", tar_file)
 
             with open(tar_file, 'wb') as f:
                 for chunk in export_data:
@@ -1091,8 +1208,7 @@ class MicroVM:
 
             container.remove(force=True)
             
-            if self._config.verbose:
-                self._logger.debug(f"Successfully exported container to {tar_file}")
+            self._logger.debug("Successfully exported container to %s", tar_file)
 
             return tar_file
                 
@@ -1120,41 +1236,36 @@ class MicroVM:
             if not tar_file or not os.path.exists(tar_file):
                 return f"Failed to export Docker image {image}"
 
-            run(f"fallocate -l {size} {file}")
-            if self._config.verbose:
-                self._logger.debug(f"Image file created: {file}")
+            run(["fallocate", "-l", size, file], shell=False)
+            self._logger.debug("Image file created: %s", file)
 
-            run(f"mkfs.ext4 {file}")
-            if self._config.verbose:
-                self._logger.debug(f"Formatting filesystem: {file} with size {size}")
+            run(["mkfs.ext4", file], shell=False)
+            self._logger.debug("Formatting filesystem: %s with size %s", file, size)
 
             tmp_dir = tempfile.mkdtemp()
-            run(f"mount -o loop {file} {tmp_dir}")
+            run(["mount", "-o", "loop", file, tmp_dir], shell=False)
 
             with tarfile.open(tar_file, 'r') as tar:
                 tar.extractall(path=tmp_dir)
 
             os.remove(tar_file)
-            if self._config.verbose:
-                self._logger.debug(f"Removed tar file: {tar_file}")
+            self._logger.debug("Removed tar file: %s", tar_file)
 
-            if self._config.verbose:
-                self._logger.info("Build rootfs completed")
+            self._logger.info("Build rootfs completed")
 
         except Exception as e:
             if tmp_dir:
-                run(f"umount {tmp_dir}", "unmounting")
+                run(["umount", tmp_dir], shell=False)
                 os.rmdir(tmp_dir)
             raise VMMError(f"Failed to create image file: {e}")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_fixed(2),
-        retry=retry_if_exception_type(SSHException)
-    )
     def _establish_ssh_connection(self, ip_addr: str, username: str, key_path: str, id: str):
         """Establish SSH connection to the VMM with retry logic.
-        
+
+        Port 22 is probed with exponential backoff first, so the connection
+        is attempted as soon as sshd is listening rather than after a fixed
+        delay.
+
         Args:
             ip_addr (str): IP address of the VMM
             username (str): SSH username
@@ -1164,12 +1275,97 @@ class MicroVM:
         Raises:
             VMMError: If connection fails after all retry attempts
         """
+        from paramiko import AutoAddPolicy, SSHException
+
+        deadline = time.monotonic() + 10
+        delay = 0.05
+        while time.monotonic() < deadline:
+            try:
+                socket.create_connection((ip_addr, 22), timeout=0.25).close()
+                break
+            except OSError:
+                time.sleep(delay)
+                delay = min(delay * 2, 0.5)
+
         self._ssh_client.set_missing_host_key_policy(AutoAddPolicy())
-        self._ssh_client.connect(
-            hostname=ip_addr,
-            username=username if username else self._config.ssh_user,
-            key_filename=key_path
-        )
+        for attempt in Retrying(
+            stop=stop_after_attempt(3),
+            wait=wait_fixed(2),
+            retry=retry_if_exception_type(SSHException),
+            reraise=True
+        ):
+            with attempt:
+                self._ssh_client.connect(
+                    hostname=ip_addr,
+                    username=username if username else self._config.ssh_user,
+                    key_filename=key_path
+                )
+
+    def _config_file(self, id: str) -> str:
+        """Get the path to the config.json of a VMM.
+
+        Args:
+            id (str): VMM ID
+
+        Returns:
+            str: Path to the config file
+        """
+        if id == self._microvm_id:
+            return self._config_path
+        return os.path.join(self._config.data_path, id, "config.json")
+
+    def _load_config(self, id: str) -> dict:
+        """Load the parsed config.json of a VMM.
+
+        Parsed configs are cached per VMM and reused for as long as the file's
+        modification time and size are unchanged. The cache keeps the most
+        recently used entries only. The returned dict is shared
+        with the cache and must not be modified; copy it first.
+
+        Args:
+            id (str): VMM ID
+
+        Returns:
+            dict: Parsed VMM configuration
+
+        Raises:
+            FileNotFoundError: If the VMM has no config file
+        """
+        config_path = self._config_file(id)
+        st = os.stat(config_path)
+        stamp = (st.st_mtime_ns, st.st_size)
+
+        cached = self._config_cache.get(id)
+        if cached and cached[0] == stamp:
+            self._config_cache.move_to_end(id)
+            return cached[1]
+
+        with open(config_path, "rb") as f:
+            config = json_loads(f.read())
+        self._config_cache[id] = (stamp, config)
+        self._config_cache.move_to_end(id)
+        if len(self._config_cache) > self._CONFIG_CACHE_SIZE:
+            self._config_cache.popitem(last=False)
+        return config
+
+    def _write_config(self, id: str, config: dict):
+        """Atomically replace the config.json of a VMM.
+
+        The data is written to a temporary file next to the config and moved
+        into place, so a crash never leaves a truncated config behind.
+
+        Args:
+            id (str): VMM ID
+            config (dict): Configuration to write
+        """
+        config_path = self._config_file(id)
+        tmp_path = f"{config_path}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(json_dumps(config))
+            os.replace(tmp_path, config_path)
+        finally:
+            self._config_cache.pop(id, None)
 
     def _setup_port_forwarding(self, host_ports, dest_ports, vmm_id=None, dest_ip=None, update_config=True):
         """Helper method to set up port forwarding rules.
@@ -1197,8 +1393,9 @@ class MicroVM:
         if len(host_ports_list) != len(dest_ports_list):
             raise ValueError("Number of host ports must match number of destination ports")
 
+        port_pairs = list(zip(host_ports_list, dest_ports_list))
         ports_config = {}
-        for host_port, dest_port in zip(host_ports_list, dest_ports_list):
+        for host_port, dest_port in port_pairs:
             self._network.add_port_forward(vmm_id, self._host_ip, host_port, dest_ip, dest_port)
             
             port_key = f"{dest_port}/tcp"
@@ -1211,22 +1408,20 @@ class MicroVM:
             })
 
         if update_config:
-            config_path = f"{self._config.data_path}/{vmm_id}/config.json"
+            config_path = self._config_file(vmm_id)
             if os.path.exists(config_path):
-                with open(config_path, "r") as f:
-                    config = json.load(f)
-                
+                config = copy.deepcopy(self._load_config(vmm_id))
+
                 if 'Ports' not in config:
                     config['Ports'] = {}
                 
                 config['Ports'].update(ports_config)
+                self._write_config(vmm_id, config)
                 
-                with open(config_path, "w") as f:
-                    json.dump(config, f)
-                
-                if self._config.verbose:
-                    self._logger.debug(f"Added {host_port} -> {dest_port} to VMM {vmm_id}")
-                    self._logger.info(f"Port forwarding added successfully for VMM {vmm_id}")
+                if self._logger.is_enabled_for("DEBUG"):
+                    forwarded = ", ".join(f"{host_port} -> {dest_port}" for host_port, dest_port in port_pairs)
+                    self._logger.debug("Added %s to VMM %s", forwarded, vmm_id)
+                self._logger.info("Port forwarding added successfully for VMM %s", vmm_id)
         
         return ports_config
 
@@ -1249,20 +1444,15 @@ class MicroVM:
 
         for host_port, dest_port in zip(host_ports_list, dest_ports_list):
             self._network.delete_port_forward(vmm_id, host_port, dest_port)
-            if self._config.verbose:
-                self._logger.debug(f"Removed {host_port} -> {dest_port} from VMM {vmm_id}")
+            self._logger.debug("Removed %s -> %s from VMM %s", host_port, dest_port, vmm_id)
         
         if update_config:
-            config_path = f"{self._config.data_path}/{vmm_id}/config.json"
+            config_path = self._config_file(vmm_id)
             if os.path.exists(config_path):
-                with open(config_path, "r") as f:
-                    config = json.load(f)
-                
+                config = copy.deepcopy(self._load_config(vmm_id))
+
                 for dest_port in dest_ports_list:
                     config['Ports'].pop(f"{dest_port}/tcp", None)
-                
-                with open(config_path, "w") as f:
-                    json.dump(config, f)
+                self._write_config(vmm_id, config)
 
-        if self._config.verbose:
-            self._logger.info(f"Port forwarding removed successfully for VMM {vmm_id}")
+        self._logger.info("Port forwarding removed successfully for VMM %s", vmm_id)
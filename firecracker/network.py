@@ -1,5 +1,6 @@
 import os
 import sys
+import socket
 import ipaddress
 from pyroute2 import IPRoute
 from firecracker.logger import Logger
@@ -46,8 +47,7 @@ class NetworkManager:
         """
         process = run("ip route | grep default | awk '{print $5}'")
         if process.returncode == 0:
-            if self._config.verbose:
-                self._logger.debug(f"Default interface name: {process.stdout.strip()}")
+            self._logger.debug("Default interface name: %s", process.stdout.strip())
 
             return process.stdout.strip()
         else:
@@ -74,8 +74,7 @@ class NetworkManager:
                 segments = ip_obj.exploded.split(':')
                 segments[-1] = '1'
                 gateway_ip = ipaddress.IPv6Address(':'.join(segments))
-                if self._config.verbose:
-                    self._logger.debug(f"Derived gateway IP: {gateway_ip}")
+                self._logger.debug("Derived gateway IP: %s", gateway_ip)
             else:
                 raise NetworkError(f"Unsupported IP address type: {ip}")
 
@@ -114,10 +113,9 @@ class NetworkManager:
                 if 'expr' in rule:
                     for expr in rule['expr']:
                         if 'match' in expr and 'right' in expr['match'] and isinstance(expr['match']['right'], str) and tap_name in expr['match']['right']:
-                            if self._config.verbose:
-                                if tap_name not in logged_tap_names:
-                                    self._logger.debug(f"Found matching rule for {tap_name} with handle {rule['handle']}")
-                                    logged_tap_names.add(tap_name)
+                            if tap_name not in logged_tap_names:
+                                self._logger.debug("Found matching rule for %s with handle %s", tap_name, rule['handle'])
+                                logged_tap_names.add(tap_name)
                             tap_rules.append({
                                 'handle': rule['handle'],
                                 'chain': rule['chain'],
@@ -263,9 +261,8 @@ class NetworkManager:
 
             for rule in rules:
                 rc, output, error = self._nft.json_cmd(rule)
-                if self._config.verbose:
-                    self._logger.info("Added NAT forwarding rule")
-                    self._logger.debug(f"NAT forwarding rule: {output}")
+                self._logger.info("Added NAT forwarding rule")
+                self._logger.debug("NAT forwarding rule: %s", output)
 
                 if rc != 0 and "File exists" not in str(error):
                     raise NetworkError(f"Failed to add NAT forwarding rule: {error}")
@@ -335,8 +332,7 @@ class NetworkManager:
                         break
 
                 if comment == expected_comment and has_masquerade:
-                    if self._config.verbose:
-                        self._logger.debug(f"Found masquerade rule with handle {rule.get('handle')}")
+                    self._logger.debug("Found masquerade rule with handle %s", rule.get('handle'))
                     return rule.get('handle')
 
         return None
@@ -356,8 +352,7 @@ class NetworkManager:
         try:
             handle = self.get_masquerade_handle()
             if handle is not None:
-                if self._config.verbose:
-                    self._logger.debug("Masquerade rule already exists")
+                self._logger.debug("Masquerade rule already exists")
                 return True
 
             add_cmd = {
@@ -388,8 +383,7 @@ class NetworkManager:
 
             result = self._nft.json_cmd(add_cmd)
             if not result[0]:
-                if self._config.verbose:
-                    self._logger.info("Created masquerade rule")
+                self._logger.info("Created masquerade rule")
                 return True
             else:
                 return False
@@ -452,13 +446,11 @@ class NetworkManager:
 
                         if 'dnat' in e and e['dnat']['addr'] == dest_ip and e['dnat']['port'] == dest_port:
                             has_correct_dnat = True
-                            if self._config.verbose:
-                                self._logger.info(f"Prerouting rule: {dest_ip}:{dest_port}")
+                            self._logger.info("Prerouting rule: %s:%s", dest_ip, dest_port)
 
                     if has_daddr_match and has_dport_match and has_correct_dnat:
-                        if self._config.verbose:
-                            self._logger.debug(f"Found matching prerouting port forward rule {rule}")
-                            self._logger.info(f"Found prerouting rule with handle {rule['handle']}")
+                        self._logger.debug("Found matching prerouting port forward rule %s", rule)
+                        self._logger.info("Found prerouting rule with handle %s", rule['handle'])
                         rules['prerouting'] = rule['handle']
 
                 # Check for POSTROUTING rules (for outgoing traffic)
@@ -479,12 +471,11 @@ class NetworkManager:
                     # Note: This function is not currently used, but if it were, it would need an 'id' parameter
                     # For now, we'll just check for masquerade rules without machine_id matching
                     if has_saddr_match and has_masquerade:
-                        if self._config.verbose:
-                            self._logger.debug(f"Found matching postrouting masquerade rule {rule}")
-                            self._logger.info(f"Found postrouting rule with handle {rule['handle']}")
+                        self._logger.debug("Found matching postrouting masquerade rule %s", rule)
+                        self._logger.info("Found postrouting rule with handle %s", rule['handle'])
                         rules['postrouting'] = rule['handle']
 
-            if not rules and self._config.verbose:
+            if not rules:
                 self._logger.info("No port forwarding rules found")
 
             return rules
@@ -528,13 +519,12 @@ class NetworkManager:
                 # Check for PREROUTING rules with matching comment only
                 if rule.get('family') == 'ip' and rule.get('table') == 'nat' and chain == 'PREROUTING':
                     if comment == prerouting_comment:
-                        if self._config.verbose:
-                            self._logger.info(f"Found prerouting rule with matching comment: {comment}")
-                            self._logger.debug(f"Rule details: {rule}")
+                        self._logger.info("Found prerouting rule with matching comment: %s", comment)
+                        self._logger.debug("Rule details: %s", rule)
                         rules['prerouting'] = rule['handle']
 
-            if not rules and self._config.verbose:
-                self._logger.info(f"No port forwarding rules found for machine_id={id} host_port={host_port} vm_port={dest_port}")
+            if not rules:
+                self._logger.info("No port forwarding rules found for machine_id=%s host_port=%s vm_port=%s", id, host_port, dest_port)
 
             return rules
 
@@ -569,8 +559,7 @@ class NetworkManager:
                     rule.get('table') == 'nat' and 
                     chain == 'POSTROUTING' and 
                     comment == postrouting_comment):
-                    if self._config.verbose:
-                        self._logger.debug(f"Found existing POSTROUTING rule for machine_id={id}")
+                    self._logger.debug("Found existing POSTROUTING rule for machine_id=%s", id)
                     return True
                     
             return False
@@ -596,8 +585,7 @@ class NetworkManager:
         # First check if the PREROUTING rule already exists
         existing_rules = self.get_port_forward_by_comment(id, host_port, dest_port)
         if existing_rules:
-            if self._config.verbose:
-                self._logger.info("Port forwarding rules already exist")
+            self._logger.info("Port forwarding rules already exist")
             return True
 
         # Check if POSTROUTING rule already exists
@@ -731,8 +719,7 @@ class NetworkManager:
                 if rc != 0 and "File exists" not in str(error):
                     raise NetworkError(f"Failed to add port forwarding rule: {error}")
 
-            if self._config.verbose:
-                self._logger.info(f"Added port forwarding rule: {host_ip}:{host_port} -> {dest_ip}:{dest_port}")
+            self._logger.info("Added port forwarding rule: %s:%s -> %s:%s", host_ip, host_port, dest_ip, dest_port)
 
         except Exception as e:
             raise NetworkError(f"Failed to add port forwarding rules: {str(e)}")
@@ -753,11 +740,10 @@ class NetworkManager:
         rc, output, error = self._nft.cmd(cmd)
 
         try:
-            if self._config.verbose:
-                if rc == 0:
-                    self._logger.debug(f"Rule with handle {rule['handle']} deleted")
-                else:
-                    self._logger.error(f"Error deleting rule with handle {rule['handle']}: {error}")
+            if rc == 0:
+                self._logger.debug("Rule with handle %s deleted", rule['handle'])
+            elif self._config.verbose:
+                self._logger.error(f"Error deleting rule with handle {rule['handle']}: {error}")
 
             return rc == 0
 
@@ -773,14 +759,12 @@ class NetworkManager:
         try:
             rules = self.get_nat_rules()
             tap_rules = self.find_tap_interface_rules(rules, tap_name)
-            if self._config.verbose:
-                self._logger.debug(f"Found {len(tap_rules)} rules for {tap_name}")
+            self._logger.debug("Found %s rules for %s", len(tap_rules), tap_name)
 
             for rule in tap_rules:
                 self.delete_rule(rule)
-                if self._config.verbose:
-                    self._logger.debug(f"Deleted rule with handle {rule['handle']}")
-                    self._logger.info("Deleted NAT rules")
+                self._logger.debug("Deleted rule with handle %s", rule['handle'])
+                self._logger.info("Deleted NAT rules")
 
         except Exception as e:
             raise NetworkError(f"Failed to delete NAT rules: {str(e)}")
@@ -797,12 +781,11 @@ class NetworkManager:
                 cmd = f'delete rule nat POSTROUTING handle {handle}'
                 rc, output, error = self._nft.cmd(cmd)
 
-                if self._config.verbose:
-                    if rc == 0:
-                        self._logger.debug(f"Deleted masquerade rule with handle {handle}")
-                        self._logger.info("Deleted masquerade rules")
-                    else:
-                        self._logger.warn(f"Error deleting masquerade rule with handle {handle}: {error}")
+                if rc == 0:
+                    self._logger.debug("Deleted masquerade rule with handle %s", handle)
+                    self._logger.info("Deleted masquerade rules")
+                elif self._config.verbose:
+                    self._logger.warn(f"Error deleting masquerade rule with handle {handle}: {error}")
 
         except Exception as e:
             raise NetworkError(f"Failed to delete masquerade rule: {str(e)}")
@@ -844,14 +827,12 @@ class NetworkManager:
                     cmd = f'delete rule nat {chain} handle {handle}'
                     rc, _, error = self._nft.cmd(cmd)
 
-                    if self._config.verbose:
-                        if rc == 0:
-                            self._logger.debug(f"{chain} rule with handle {handle} deleted")
-                        else:
-                            self._logger.warn(f"Error deleting {chain} rule with handle {handle}: {error}")
+                    if rc == 0:
+                        self._logger.debug("%s rule with handle %s deleted", chain, handle)
+                    elif self._config.verbose:
+                        self._logger.warn(f"Error deleting {chain} rule with handle {handle}: {error}")
 
-            if self._config.verbose:
-                self._logger.info(f"Deleted port forwarding rule for {id} with host port {host_port}")
+            self._logger.info("Deleted port forwarding rule for %s with host port %s", id, host_port)
 
         except Exception as e:
             raise NetworkError(f"Failed to delete port forward rules: {str(e)}")
@@ -893,8 +874,7 @@ class NetworkManager:
                         rules_to_delete['postrouting'].append(rule['handle'])
 
             if not rules_to_delete:
-                if self._config.verbose:
-                    self._logger.info("No port forwarding rules found")
+                self._logger.info("No port forwarding rules found")
                 return
 
             for chain, handles in rules_to_delete.items():
@@ -902,15 +882,13 @@ class NetworkManager:
                     cmd = f'delete rule nat {chain.upper()} handle {handle}'
                     rc, output, error = self._nft.cmd(cmd)
 
-                    if self._config.verbose:
-                        if rc == 0:
-                            self._logger.debug(f"{chain} rule with handle {handle} deleted")
-                            self._logger.info("Deleted port forwarding rules")
-                        else:
-                            self._logger.warn(f"Error deleting {chain} rule with handle {handle}: {error}")
+                    if rc == 0:
+                        self._logger.debug("%s rule with handle %s deleted", chain, handle)
+                        self._logger.info("Deleted port forwarding rules")
+                    elif self._config.verbose:
+                        self._logger.warn(f"Error deleting {chain} rule with handle {handle}: {error}")
 
-            if self._config.verbose:
-                self._logger.info(f"Deleted all port forwarding rules for {id}")
+            self._logger.info("Deleted all port forwarding rules for %s", id)
 
         except Exception as e:
             raise NetworkError(f"Failed to delete port forward rules: {str(e)}")
@@ -931,39 +909,39 @@ class NetworkManager:
         try:
             new_network = IPv4Network(f"{ip_addr}/{prefix_len}", strict=False)
 
-            ifaces = self._ipr.get_links()
-            
-            for iface in ifaces:
-                idx = iface['index']
-                addresses = self._ipr.get_addr(index=idx)
-                
-                for addr in addresses:
-                    for attr_name, attr_value in addr.get('attrs', []):
-                        if attr_name == 'IFA_ADDRESS':
-                            if ':' in attr_value:
-                                continue
-                            
-                            existing_prefix = addr.get('prefixlen', 24)
-                            existing_network = IPv4Network(
-                                f"{attr_value}/{existing_prefix}", 
-                                strict=False
-                            )
-
-                            if new_network.overlaps(existing_network):
-                                if self._config.verbose:
-                                    self._logger.warn(
-                                        f"CIDR conflict detected: {new_network} "
-                                        f"overlaps with existing {existing_network}"
-                                    )
-                                return False
+            for existing_network in self._get_host_networks():
+                if new_network.overlaps(existing_network):
+                    if self._config.verbose:
+                        self._logger.warn(
+                            f"CIDR conflict detected: {new_network} "
+                            f"overlaps with existing {existing_network}"
+                        )
+                    return False
             return True
-            
+
         except (AddressValueError, ValueError) as e:
             raise NetworkError(f"Invalid IP address format: {str(e)}")
 
         except Exception as e:
             raise NetworkError(f"Failed to check CIDR conflicts: {str(e)}")
 
+    def _get_host_networks(self) -> list:
+        """Get the IPv4 networks assigned to the host interfaces.
+
+        Uses a single netlink dump of all IPv4 addresses instead of
+        querying each link separately.
+
+        Returns:
+            list: IPv4Network objects for every address on the host
+        """
+        networks = []
+        for addr in self._ipr.get_addr(family=socket.AF_INET):
+            for attr_name, attr_value in addr.get('attrs', []):
+                if attr_name == 'IFA_ADDRESS':
+                    existing_prefix = addr.get('prefixlen', 24)
+                    networks.append(IPv4Network(f"{attr_value}/{existing_prefix}", strict=False))
+        return networks
+
     def suggest_non_conflicting_ip(self, preferred_ip: str, prefix_len: int = 24) -> str:
         """Suggest a non-conflicting IP address based on the preferred IP.
         
@@ -979,18 +957,31 @@ class NetworkManager:
         """
         try:
             ip_obj = ipaddress.ip_address(preferred_ip)
-            
-            for i in range(10):
-                if isinstance(ip_obj, IPv4Address):
-                    octets = str(ip_obj).split('.')
-                    new_third_octet = (int(octets[2]) + i + 1) % 256
-                    new_ip = f"{octets[0]}.{octets[1]}.{new_third_octet}.{octets[3]}"
-                    
-                    if not self.detect_cidr_conflict(new_ip, prefix_len):
-                        self._logger.debug(f"Suggested non-conflicting IP: {new_ip}")
-                        return new_ip
-            
-            raise NetworkError("Unable to find a non-conflicting IP address")
+            if not isinstance(ip_obj, IPv4Address):
+                raise NetworkError("Unable to find a non-conflicting IP address")
+
+            octets = str(ip_obj).split('.')
+            candidates = (
+                f"{octets[0]}.{octets[1]}.{(int(octets[2]) + i + 1) % 256}.{octets[3]}"
+                for i in range(10)
+            )
+            host_networks = self._get_host_networks()
+
+            new_ip = next(
+                (
+                    ip for ip in candidates
+                    if not any(
+                        IPv4Network(f"{ip}/{prefix_len}", strict=False).overlaps(network)
+                        for network in host_networks
+                    )
+                ),
+                None
+            )
+            if new_ip is None:
+                raise NetworkError("Unable to find a non-conflicting IP address")
+
+            self._logger.debug("Suggested non-conflicting IP: %s", new_ip)
+            return new_ip
             
         except Exception as e:
             raise NetworkError(f"Failed to suggest non-conflicting IP: {str(e)}")
@@ -1022,8 +1013,7 @@ class NetworkManager:
 
             self._ipr.link('set', index=idx, state='up')
             
-            if self._config.verbose:
-                self._logger.debug(f"Created TAP device {tap_name}")
+            self._logger.debug("Created TAP device %s", tap_name)
 
         except Exception as e:
             self.cleanup(tap_name)
@@ -1039,8 +1029,7 @@ class NetworkManager:
             if self.check_tap_device(name):
                 idx = self._ipr.link_lookup(ifname=name)[0]
                 self._ipr.link('del', index=idx)
-                if self._config.verbose:
-                    self._logger.info(f"Removed tap device {name}")
+                self._logger.info("Removed tap device %s", name)
             return True
 
         except Exception as e:
@@ -1,7 +1,7 @@
 import os
 import time
+import select
 import psutil
-import subprocess
 from datetime import datetime
 from firecracker.logger import Logger
 from firecracker.config import MicroVMConfig
@@ -14,6 +14,8 @@ from tenacity import (
     stop_after_attempt,
 )
 
+SOCKET_WAIT_TIMEOUT = 5
+
 
 class ProcessManager:
     """Manages process-related operations for Firecracker microVMs."""
@@ -42,47 +44,80 @@ class ProcessManager:
             log_path = f"{self._config.data_path}/{id}/firecracker.log"
             pid_path = f"{self._config.data_path}/{id}/firecracker.pid"
 
-            # Get parent's process group
-            parent_pgid = os.getpgid(0)
-
-            process = subprocess.Popen(
+            # A single posix_spawn() instead of fork+exec: nothing runs in the
+            # child before exec, and the child stays in the parent's group.
+            # posix_spawnp() searches PATH for a bare binary name like Popen.
+            pid = os.posix_spawnp(
+                cmd[0],
                 cmd,
-                stdout=open(log_path, "w"),
-                stderr=subprocess.DEVNULL,
-                stdin=subprocess.DEVNULL,
-                # Explicitly set to parent's group
-                preexec_fn=lambda: os.setpgid(0, parent_pgid),
+                os.environ,
+                file_actions=[
+                    (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+                    (os.POSIX_SPAWN_OPEN, 1, log_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644),
+                    (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+                ],
+                setpgroup=os.getpgid(0),
             )
 
-            time.sleep(0.5)
-
-            if process.poll() is not None:
-                raise ProcessError("Firecracker process exited during startup")
-
-            proc = psutil.Process(process.pid)
-            if proc.status() == psutil.STATUS_ZOMBIE:
-                raise ProcessError("Firecracker process became defunct")
-
-            try:
-                proc.wait(timeout=1)
-            except psutil.TimeoutExpired:
-                pass
-            except psutil.NoSuchProcess:
-                raise ProcessError("Firecracker process disappeared during startup")
+            socket_path = args[args.index("--api-sock") + 1] if "--api-sock" in args else None
+            self._wait_for_socket(pid, socket_path)
 
             with open(pid_path, "w") as f:
-                f.write(str(process.pid))
+                f.write(str(pid))
 
-            if self._logger.verbose:
-                self._logger.debug(
-                    f"Firecracker process started with PID: {process.pid}"
-                )
+            self._logger.debug("Firecracker process started with PID: %s", pid)
 
-            return process.pid
+            return pid
 
         except Exception as e:
             raise ProcessError(f"Failed to start Firecracker: {str(e)}")
 
+    @staticmethod
+    def _wait_for_socket(pid: int, socket_path: str = None):
+        """Wait until Firecracker has created its API socket.
+
+        The socket path is polled with exponential backoff, starting at
+        10 ms and capped at 160 ms. Between polls the wait blocks on a pidfd
+        of the process where available, so an early exit wakes it up at once
+        instead of at the next poll.
+
+        Args:
+            pid (int): PID of the spawned Firecracker process
+            socket_path (str, optional): Path of the API socket. If not set,
+                only checks that the process did not exit right away.
+
+        Raises:
+            ProcessError: If the process exits or the socket does not appear
+                within SOCKET_WAIT_TIMEOUT seconds
+        """
+        try:
+            pidfd = os.pidfd_open(pid)
+        except (AttributeError, OSError):
+            pidfd = None
+
+        deadline = time.monotonic() + SOCKET_WAIT_TIMEOUT
+        delay = 0.01
+        try:
+            while True:
+                try:
+                    exited = os.waitpid(pid, os.WNOHANG)[0] == pid
+                except ChildProcessError:
+                    exited = True
+                if exited:
+                    raise ProcessError("Firecracker process exited during startup")
+                if socket_path is None or os.path.exists(socket_path):
+                    return
+                if time.monotonic() >= deadline:
+                    raise ProcessError(f"Timed out waiting for API socket {socket_path}")
+                if pidfd is None:
+                    time.sleep(delay)
+                else:
+                    select.select([pidfd], [], [], delay)
+                delay = min(delay * 2, 0.16)
+        finally:
+            if pidfd is not None:
+                os.close(pidfd)
+
     @retry(
         stop=stop_after_delay(3),
         wait=wait_fixed(0.5),
@@ -97,17 +132,14 @@ class ProcessManager:
 
                 try:
                     os.kill(pid, 0)
-                    if self._logger.verbose:
-                        self._logger.debug(f"Firecracker is running with PID: {pid}")
+                    self._logger.debug("Firecracker is running with PID: %s", pid)
                     return True
                 except OSError:
-                    if self._logger.verbose:
-                        self._logger.info("Firecracker is not running (stale PID file)")
+                    self._logger.info("Firecracker is not running (stale PID file)")
                     os.remove(f"{self._config.data_path}/{id}/firecracker.pid")
                     return False
             else:
-                if self._logger.verbose:
-                    self._logger.info("Firecracker is not running")
+                self._logger.info("Firecracker is not running")
                 return False
 
         except Exception as e:
@@ -147,25 +179,16 @@ class ProcessManager:
                         self._logger.warn(f"Failed to stop Firecracker (1st attempt): {e}")
 
                 # If PID-based stop failed, search for actual running process
-                if self._logger.verbose:
-                    self._logger.info(
-                        f"PID {original_pid} not found, searching for running Firecracker process for VM {id}"
-                    )
+                self._logger.info("PID %s not found, searching for running Firecracker process for VM %s", original_pid, id)
 
                 actual_pid = self._find_running_process(id)
                 if actual_pid:
-                    if self._logger.verbose:
-                        self._logger.info(
-                            f"Found running Firecracker process {actual_pid} for VM {id}"
-                        )
+                    self._logger.info("Found running Firecracker process %s for VM %s", actual_pid, id)
                     if self._try_stop_process(actual_pid, id):
                         self._cleanup_files(id)
                         return True
                 else:
-                    if self._logger.verbose:
-                        self._logger.info(
-                            f"No running Firecracker process found for VM {id}"
-                        )
+                    self._logger.info("No running Firecracker process found for VM %s", id)
 
                 # Clean up files even if no process found
                 self._cleanup_files(id)
@@ -174,8 +197,7 @@ class ProcessManager:
                 # Clean up files even if no process found
                 self._cleanup_files(id)
 
-                if self._logger.verbose:
-                    self._logger.info("Firecracker is not running (no PID file)")
+                self._logger.info("Firecracker is not running (no PID file)")
                 return False
 
         except Exception as e:
@@ -201,6 +223,13 @@ class ProcessManager:
             """Wait for process to die with timeout."""
             start_time = time.time()
             while time.time() - start_time < timeout:
+                try:
+                    # Reap the process if it is our child, otherwise it stays
+                    # a zombie and keeps answering kill(pid, 0)
+                    if os.waitpid(pid, os.WNOHANG)[0] == pid:
+                        return True
+                except ChildProcessError:
+                    pass
                 try:
                     os.kill(pid, 0)  # Check if process exists
                     time.sleep(1)  # Wait 1 second before next check
@@ -216,8 +245,7 @@ class ProcessManager:
             os.kill(pid, 0)
         except OSError as e:
             if e.errno == 3:  # ESRCH - No such process
-                if self._logger.verbose:
-                    self._logger.info(f"Firecracker process {pid} already terminated")
+                self._logger.info("Firecracker process %s already terminated", pid)
                 return True
             else:
                 raise ProcessError(f"Failed to check process {pid}: {e}")
@@ -225,17 +253,11 @@ class ProcessManager:
         # Process exists, try graceful shutdown first
         try:
             os.kill(pid, 15)  # SIGTERM
-            if self._logger.verbose:
-                self._logger.debug(
-                    f"Sent SIGTERM to process {pid}, waiting for termination..."
-                )
+            self._logger.debug("Sent SIGTERM to process %s, waiting for termination...", pid)
 
             # Wait for process to die after SIGTERM
             if wait_for_process_death(pid, timeout=2):
-                if self._logger.verbose:
-                    self._logger.info(
-                        f"Firecracker process {pid} terminated after SIGTERM"
-                    )
+                self._logger.info("Firecracker process %s terminated after SIGTERM", pid)
                 return True
             else:
                 if self._logger.verbose:
@@ -245,10 +267,7 @@ class ProcessManager:
 
         except OSError as e:
             if e.errno == 3:  # ESRCH - No such process
-                if self._logger.verbose:
-                    self._logger.info(
-                        f"Firecracker process {pid} terminated after SIGTERM"
-                    )
+                self._logger.info("Firecracker process %s terminated after SIGTERM", pid)
                 return True
             else:
                 raise ProcessError(f"Failed to send SIGTERM to process {pid}: {e}")
@@ -256,17 +275,11 @@ class ProcessManager:
         # Process still running after SIGTERM, try force kill
         try:
             os.kill(pid, 9)  # SIGKILL
-            if self._logger.verbose:
-                self._logger.debug(
-                    f"Sent SIGKILL to process {pid}, waiting for termination..."
-                )
+            self._logger.debug("Sent SIGKILL to process %s, waiting for termination...", pid)
 
             # Wait for process to die after SIGKILL
             if wait_for_process_death(pid, timeout=5):
-                if self._logger.verbose:
-                    self._logger.info(
-                        f"Firecracker process {pid} force killed with SIGKILL"
-                    )
+                self._logger.info("Firecracker process %s force killed with SIGKILL", pid)
                 return True
             else:
                 raise ProcessError(
@@ -275,10 +288,7 @@ class ProcessManager:
 
         except OSError as e:
             if e.errno == 3:  # ESRCH - No such process
-                if self._logger.verbose:
-                    self._logger.info(
-                        f"Firecracker process {pid} terminated after SIGKILL"
-                    )
+                self._logger.info("Firecracker process %s terminated after SIGKILL", pid)
                 return True
             else:
                 raise ProcessError(f"Failed to kill process {pid}: {e}")
@@ -329,8 +339,7 @@ class ProcessManager:
         if os.path.exists(pid_file):
             try:
                 os.remove(pid_file)
-                if self._logger.verbose:
-                    self._logger.debug(f"Removed PID file for VM {id}")
+                self._logger.debug("Removed PID file for VM %s", id)
             except OSError as e:
                 if self._logger.verbose:
                     self._logger.warn(f"Failed to remove PID file: {e}")
@@ -340,8 +349,7 @@ class ProcessManager:
         if os.path.exists(socket_path):
             try:
                 os.remove(socket_path)
-                if self._logger.verbose:
-                    self._logger.debug(f"Removed socket file: {socket_path}")
+                self._logger.debug("Removed socket file: %s", socket_path)
             except OSError as e:
                 if self._logger.verbose:
                     self._logger.warn(f"Failed to remove socket file: {e}")
@@ -380,10 +388,7 @@ class ProcessManager:
                     "%Y-%m-%d %H:%M:%S"
                 )
 
-                if self._logger.verbose:
-                    self._logger.debug(
-                        f"Found Firecracker process {pid} created at {create_time}"
-                    )
+                self._logger.debug("Found Firecracker process %s created at %s", pid, create_time)
 
                 return pid, create_time
 
@@ -1,13 +1,24 @@
 import os
+import json
 import random
 import string
+import fcntl
 import signal
+import shutil
 import requests
 import subprocess
 import socket
 from faker import Faker
 from tenacity import retry, stop_after_attempt, wait_fixed, retry_if_exception_type
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+FICLONE = 0x40049409
+
 
 def run(cmd, **kwargs):
     """Execute a shell command with configurable options.
@@ -42,6 +53,45 @@ def run(cmd, **kwargs):
     return subprocess.run(cmd, **default_kwargs)
 
 
+def clone_file(src: str, dst: str) -> None:
+    """Copy a file using the cheapest mechanism the filesystem supports.
+
+    Tries a reflink (FICLONE) first, which shares extents on Btrfs, XFS and
+    other CoW filesystems. Falls back to an in-kernel copy_file_range() into
+    a preallocated destination and finally to shutil.copyfile(), which is
+    also used if copy_file_range() stops short of the source size.
+
+    Args:
+        src (str): Source file path
+        dst (str): Destination file path, created or truncated
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            return
+        except OSError:
+            pass
+
+        try:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            if remaining:
+                try:
+                    os.posix_fallocate(fdst.fileno(), 0, remaining)
+                except OSError:
+                    pass
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+            if remaining == 0:
+                return
+        except (AttributeError, OSError):
+            pass
+
+    shutil.copyfile(src, dst)
+
+
 def safe_kill(pid: int, sig: signal.Signals = signal.SIGTERM) -> bool:
     """Safely kill a process."""
     try:
@@ -53,6 +103,40 @@ def safe_kill(pid: int, sig: signal.Signals = signal.SIGTERM) -> bool:
         return False
 
 
+def json_loads(data):
+    """Deserialize a JSON document, using orjson when it is installed.
+
+    Args:
+        data (bytes or str): JSON document
+
+    Returns:
+        The decoded Python object
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj) -> bytes:
+    """Serialize an object to compact UTF-8 encoded JSON.
+
+    Uses orjson when it is installed, which emits bytes directly; otherwise
+    falls back to the standard library with compact separators.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        bytes: Encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
 def generate_id() -> str:
     """Generate a random ID for the MicroVM instance.
 
@@ -2,12 +2,13 @@ import os
 import re
 import json
 from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from firecracker.logger import Logger
 from firecracker.api import Api
 from firecracker.config import MicroVMConfig
 from firecracker.network import NetworkManager
 from firecracker.process import ProcessManager
-from firecracker.utils import requires_id
+from firecracker.utils import requires_id, json_loads, json_dumps
 from firecracker.exceptions import VMMError
 
 
@@ -72,11 +73,10 @@ class VMMManager:
             os.makedirs(vmm_dir, exist_ok=True)
             
             file_path = f"{vmm_dir}/config.json"
-            with open(file_path, 'w') as json_file:
-                json.dump(vm_data, json_file, indent=4)
+            with open(file_path, 'wb') as json_file:
+                json_file.write(json_dumps(vm_data))
 
-            if self._config.verbose:
-                self._logger.debug(f"Created VMM config file: {file_path}")
+            self._logger.debug("Created VMM config file: %s", file_path)
 
             return file_path
 
@@ -114,13 +114,13 @@ class VMMManager:
 
             config_path = os.path.join(vmm_path, 'config.json')
             if not (os.path.isdir(vmm_path) and os.path.exists(config_path)):
-                if has_running_vmms and self._config.verbose:
-                    self._logger.info(f"Config file not found for VMM ID: {vmm_id}")
+                if has_running_vmms:
+                    self._logger.info("Config file not found for VMM ID: %s", vmm_id)
                 continue
 
             try:
-                with open(config_path, 'r') as config_file:
-                    config_data = json.load(config_file)
+                with open(config_path, 'rb') as config_file:
+                    config_data = json_loads(config_file.read())
                     
                 pid = config_data.get('State', {}).get('Pid', '')
                 
@@ -179,48 +179,19 @@ class VMMManager:
             List[str]: List of VMM IDs that match the state and all the labels
         """
         try:
-            matching_vmm_ids = []
-
-            vmm_list = self.list_vmm()
-            
-            if not vmm_list:
-                return matching_vmm_ids
-
-            state_matching_vmms = [
-                vmm_info for vmm_info in vmm_list 
-                if vmm_info['state'] == state
+            # list_vmm() already parsed every config, labels included, so the
+            # match is done in memory instead of reading each config again.
+            wanted = (labels or {}).items()
+            return [
+                {
+                    'id': vmm_info['id'],
+                    'name': vmm_info['name'],
+                    'state': vmm_info['state'],
+                    'created_at': vmm_info['created_at'],
+                }
+                for vmm_info in self.list_vmm()
+                if vmm_info['state'] == state and wanted <= vmm_info['labels'].items()
             ]
-            
-            if not state_matching_vmms:
-                return matching_vmm_ids
-            
-            for vmm_info in state_matching_vmms:
-                vmm_id = vmm_info['id']
-                config_path = os.path.join(self._config.data_path, vmm_id, 'config.json')
-                
-                if not os.path.exists(config_path):
-                    continue
-                    
-                try:
-                    with open(config_path, 'r') as config_file:
-                        config_data = json.load(config_file)
-                    
-                    vmm_labels = config_data.get('Labels', {})
-                    if all(vmm_labels.get(key) == value for key, value in labels.items()):
-                        vmm_info = {
-                            'id': config_data.get('ID', vmm_id),
-                            'name': config_data.get('Name', ''),
-                            'state': "Running" if config_data.get('State', {}).get('Running', False) else "Paused",
-                            'created_at': config_data.get('CreatedAt', ''),
-                        }
-                        matching_vmm_ids.append(vmm_info)
-                        
-                except (json.JSONDecodeError, IOError) as e:
-                    if self._config.verbose:
-                        self._logger.warn(f"Failed to read config for VMM {vmm_id}: {e}")
-                    continue
-
-            return matching_vmm_ids
 
         except Exception as e:
             raise VMMError(f"Error finding VMM by labels: {str(e)}")
@@ -238,10 +209,7 @@ class VMMManager:
             api = self.get_api(id)
             response = api.vm.patch(state=state)
 
-            if self._config.verbose:
-                self._logger.debug(
-                    f"Changed VMM {id} state response: {response}"
-                )
+            self._logger.debug("Changed VMM %s state response: %s", id, response)
 
             return f"{state} VMM {id} successfully"
 
@@ -269,10 +237,7 @@ class VMMManager:
             api = self.get_api(id)
             response = api.vm_config.get().json()
 
-            if self._config.verbose:
-                self._logger.debug(
-                    f"VMM {id} configuration response: {response}"
-                )
+            self._logger.debug("VMM %s configuration response: %s", id, response)
 
             return response
 
@@ -335,10 +300,7 @@ class VMMManager:
                 return ip_addr
 
             else:
-                if self._config.verbose:
-                    self._logger.info(
-                        f"No ip= found in boot-args for VMM {id}"
-                    )
+                self._logger.info("No ip= found in boot-args for VMM %s", id)
                 return 'Unknown'
 
         except Exception as e:
@@ -381,8 +343,7 @@ class VMMManager:
         try:
             if not os.path.exists(path):
                 os.makedirs(path, exist_ok=True)
-                if self._config.verbose:
-                    self._logger.info(f"Directory {path} is created")
+                self._logger.info("Directory %s is created", path)
 
         except Exception as e:
             raise VMMError(f"Failed to create directory at {path}: {str(e)}")
@@ -399,8 +360,7 @@ class VMMManager:
             if not os.path.exists(f"{log_dir}/{log_file}"):
                 with open(f"{log_dir}/{log_file}", 'w'):
                     pass
-                if self._config.verbose:
-                    self._logger.info(f"Log file {log_dir}/{log_file} is created")
+                self._logger.info("Log file %s/%s is created", log_dir, log_file)
 
         except Exception as e:
             raise VMMError(
@@ -422,24 +382,29 @@ class VMMManager:
 
             if os.path.exists(vmm_dir):
                 shutil.rmtree(vmm_dir)
-                if self._config.verbose:
-                    self._logger.info(f"Directory {vmm_dir} is removed")
+                self._logger.info("Directory %s is removed", vmm_dir)
 
         except Exception as e:
             self._logger.error(f"Failed to remove {vmm_dir} directory: {str(e)}")
             raise VMMError(f"Failed to remove {vmm_dir} directory: {str(e)}")
 
-    def delete_vmm(self, id: str = None) -> str:
+    def delete_vmm(self, id: str = None, vmm_list: List[Dict] = None) -> str:
         """Delete VMM instances from the config.json file.
 
         Args:
             id (str, optional): ID of specific VMM to delete. If None, deletes all VMMs.
+            vmm_list (List[Dict], optional): Result of a previous list_vmm() call
+                to reuse instead of listing the VMMs again.
 
         Returns:
             str: Status message indicating deletion results
+
+        Raises:
+            VMMError: If any of the VMMs could not be deleted when deleting all
         """
         try:
-            vmm_list = self.list_vmm()
+            if vmm_list is None:
+                vmm_list = self.list_vmm()
             
             if not vmm_list:
                 return "No VMMs found to delete"
@@ -451,19 +416,37 @@ class VMMManager:
             else:
                 ids_to_delete = [vmm['id'] for vmm in vmm_list]
 
+            # Stopping a process waits on signal delivery, so the VMMs are
+            # stopped concurrently. Network and directory cleanup stay
+            # sequential because the netlink and nftables handles are shared.
+            failed = {}
+            with ThreadPoolExecutor(max_workers=min(16, len(ids_to_delete))) as executor:
+                futures = {executor.submit(self._process.stop, vmm_id): vmm_id for vmm_id in ids_to_delete}
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        failed[futures[future]] = e
+
             deleted_count = 0
             for vmm_id in ids_to_delete:
+                if vmm_id in failed:
+                    continue
                 try:
-                    self.cleanup(vmm_id)
+                    self._network.cleanup(f"tap_{vmm_id}")
+                    self.delete_vmm_dir(vmm_id)
                     deleted_count += 1
-                    if self._config.verbose:
-                        self._logger.info(f"Removed VMM {vmm_id}")
+                    self._logger.info("Removed VMM %s", vmm_id)
                 except Exception as e:
-                    self._logger.error(f"Failed to delete VMM {vmm_id}: {e}")
-                    continue
+                    failed[vmm_id] = e
+
+            for vmm_id, e in failed.items():
+                self._logger.error(f"Failed to delete VMM {vmm_id}: {e}")
 
             if id:
                 return f"VMM {id} {'removed' if deleted_count > 0 else 'not found'}"
+            elif failed:
+                raise VMMError(f"Deleted {deleted_count} VMM(s), failed to delete {len(failed)}: {', '.join(failed)}")
             else:
                 return f"Deleted {deleted_count} VMM(s)"
 
@@ -494,10 +477,7 @@ class VMMManager:
 
             if os.path.exists(socket_file):
                 os.unlink(socket_file)
-                if self._config.verbose:
-                    self._logger.info(
-                        f"Unlinked existing socket file {socket_file}"
-                    )
+                self._logger.info("Unlinked existing socket file %s", socket_file)
 
             self.create_vmm_dir(f"{self._config.data_path}/{id}")
             return socket_file
@@ -5,9 +5,10 @@ import string
 import pytest
 from firecracker import MicroVM
 from firecracker.vmm import VMMManager
+from firecracker.logger import Logger
 from firecracker.network import NetworkManager
 from firecracker.exceptions import VMMError, NetworkError
-from firecracker.utils import generate_id, validate_ip_address
+from firecracker.utils import generate_id, validate_ip_address, clone_file
 
 KERNEL_FILE = "/var/lib/firecracker/vmlinux-6.1.0"
 BASE_ROOTFS = "/var/lib/firecracker/devsecops-box.img"
@@ -338,6 +339,17 @@ def test_network_conflict_detection():
     assert suggested_ip != ip_addr
 
 
+def test_suggest_non_conflicting_ip_skips_host_networks(monkeypatch):
+    """Test the suggested IP avoids networks already used by the host"""
+    from ipaddress import IPv4Network
+
+    network_manager = NetworkManager()
+    monkeypatch.setattr(network_manager, "_get_host_networks",
+                        lambda: [IPv4Network("10.0.0.0/24"), IPv4Network("10.0.1.0/24")])
+
+    assert network_manager.suggest_non_conflicting_ip("10.0.0.2", 24) == "10.0.2.2"
+
+
 def test_port_forwarding():
     """Test port forwarding for a VM"""
     vm = MicroVM(kernel_file=KERNEL_FILE, base_rootfs=BASE_ROOTFS)
@@ -543,6 +555,40 @@ def test_memory_size_conversion():
         assert vm._memory == expected_mb
 
 
+def test_parse_ports():
+    """Test parsing port values from various input formats"""
+    vm = MicroVM(kernel_file=KERNEL_FILE, base_rootfs=BASE_ROOTFS)
+
+    test_cases = [
+        (None, []),
+        (22, [22]),
+        ("22", [22]),
+        ("22, 80,443", [22, 80, 443]),
+        ("22,http", [22]),
+        ("8000-9000", []),
+        ("80:8080", []),
+        ("22a", []),
+        ([22, "80", "http"], [22, 80]),
+    ]
+
+    for port_value, expected in test_cases:
+        assert vm._parse_ports(port_value) == expected
+
+
+def test_clone_file(tmp_path):
+    """Test cloning a file produces an identical copy"""
+    src = tmp_path / "base.img"
+    dst = tmp_path / "clone.img"
+    src.write_bytes(os.urandom(3 * 1024 * 1024 + 17))
+
+    clone_file(str(src), str(dst))
+    assert dst.read_bytes() == src.read_bytes()
+
+    src.write_bytes(b"")
+    clone_file(str(src), str(dst))
+    assert dst.read_bytes() == b""
+
+
 def test_network_manager_interface_detection():
     """Test network interface detection"""
     network_manager = NetworkManager()
@@ -591,3 +637,35 @@ def test_network_overlap_check():
     # Test overlap detection
     has_overlap = vmm_manager.check_network_overlap("172.16.0.2")
     assert isinstance(has_overlap, bool)
+
+
+def test_logger_threshold(capsys):
+    """Test non-verbose loggers drop messages below WARNING"""
+    logger = Logger(level="DEBUG", verbose=False)
+    assert not logger.is_enabled_for("INFO")
+    assert logger.is_enabled_for("WARNING")
+    assert logger.is_enabled_for("WARN")
+
+    logger.info("hidden %s", "info")
+    logger.warn("shown %s", "warning")
+    err = capsys.readouterr().err
+    assert "hidden info" not in err
+    assert "shown warning" in err
+
+    verbose_logger = Logger(level="DEBUG", verbose=True)
+    assert verbose_logger.is_enabled_for("DEBUG")
+
+
+def test_find_vmm_by_labels_filters_in_memory(monkeypatch):
+    """Test finding VMMs by state and labels from the listed configs"""
+    vmm_manager = VMMManager()
+    vmms = [
+        {'id': 'a', 'name': 'vm-a', 'state': 'Running', 'created_at': '', 'labels': {'env': 'test', 'tier': 'web'}},
+        {'id': 'b', 'name': 'vm-b', 'state': 'Running', 'created_at': '', 'labels': {'env': 'prod'}},
+        {'id': 'c', 'name': 'vm-c', 'state': 'Paused', 'created_at': '', 'labels': {'env': 'test'}},
+    ]
+    monkeypatch.setattr(vmm_manager, "list_vmm", lambda: vmms)
+
+    assert [v['id'] for v in vmm_manager.find_vmm_by_labels('Running', {'env': 'test'})] == ['a']
+    assert [v['id'] for v in vmm_manager.find_vmm_by_labels('Running', {'env': 'test', 'tier': 'db'})] == []
+    assert [v['id'] for v in vmm_manager.find_vmm_by_labels('Running', None)] == ['a', 'b']